@@ -11,13 +11,16 @@
 from abc import abstractmethod, abstractproperty
 from collections import Counter
 from collections.abc import Collection, Mapping
-from dataclasses import dataclass
-from typing import Protocol, Union
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Protocol, Union
 
 from typing_extensions import TypeAlias
 
 from quri_parts.circuit import ImmutableQuantumCircuit
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 #: SamplingCounts represents count statistics of repeated sampling or the
 #: measurement probabilities of a quantum circuit. Keys are observed bit
 #: patterns encoded in integers and values are counts of observation or the
@@ -44,7 +47,11 @@ class CompositeSamplingResult(SamplingResult):
     def counts(self) -> SamplingCounts:
         total = Counter[int]()
         for r in self.results:
-            total += Counter(r.counts)
+            total.update(r.counts)
+            # Drop non-positive counts at each step, as the addition of Counters
+            # does.
+            for key in [k for k, v in total.items() if v <= 0]:
+                del total[key]
         return total
 
 
@@ -63,12 +70,23 @@ class SamplingJob(Protocol):
 
 @dataclass(frozen=True)
 class CompositeSamplingJob(SamplingJob):
-    """A sampling job containing multiple sampling jobs."""
+    """A sampling job containing multiple sampling jobs.
+
+    If ``executor`` is given, the results of the jobs are waited for
+    concurrently on it, so that the waiting time is not the sum of those of the
+    jobs when retrieving a result blocks (e.g. on network communication). Note
+    that the jobs of some backends may not be safe to wait for from multiple
+    threads.
+    """
 
     jobs: Collection[SamplingJob]
+    executor: Optional["Executor"] = field(default=None, compare=False)
 
     def result(self) -> SamplingResult:
-        return CompositeSamplingResult(results=[job.result() for job in self.jobs])
+        if self.executor is None or len(self.jobs) <= 1:
+            return CompositeSamplingResult(results=[job.result() for job in self.jobs])
+        results = list(self.executor.map(lambda job: job.result(), self.jobs))
+        return CompositeSamplingResult(results=results)
 
 
 class SamplingBackend(Protocol):
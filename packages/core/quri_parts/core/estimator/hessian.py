@@ -8,16 +8,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Collection, Iterable
+from concurrent.futures import as_completed
 from dataclasses import dataclass
-from typing import Optional, Sequence, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, Sequence, TypeVar, Union, cast
+from weakref import WeakKeyDictionary
 
 import numpy as np
+import numpy.typing as npt
+import scipy.sparse as sparse
 
 from quri_parts.circuit import LinearParameterMapping
-from quri_parts.circuit.parameter_shift import ShiftedParameters
+from quri_parts.circuit.parameter_shift import (
+    ParameterShiftsAndCoef,
+    ShiftedParameters,
+)
 from quri_parts.core.estimator import (
     ConcurrentParametricQuantumEstimator,
     Estimatable,
+    Estimate,
     HessianEstimator,
     MatrixEstimates,
 )
@@ -26,6 +35,9 @@ from quri_parts.core.state import (
     ParametricQuantumStateVector,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 _ParametricStateT = TypeVar(
     "_ParametricStateT",
     bound=Union[ParametricCircuitQuantumState, ParametricQuantumStateVector],
@@ -43,6 +55,9 @@ def parameter_shift_hessian_estimates(
     state: _ParametricStateT,
     params: Sequence[float],
     estimator: ConcurrentParametricQuantumEstimator[_ParametricStateT],
+    executor: Optional["Executor"] = None,
+    tile_size: int = 256,
+    dtype: npt.DTypeLike = np.complex128,
 ) -> MatrixEstimates[complex]:
     """Estimate a hessian of an expectation value of a given operator for a
     parametric state with respect to the state parameter by the parameter shift
@@ -57,54 +72,206 @@ def parameter_shift_hessian_estimates(
         params: Parameter values for which the hessian is estimated.
         estimator: An estimator that estimates expectation values
             of the operator for the parametric states.
+        executor: An optional executor. If given, the shifted parameters are split
+            into tiles of ``tile_size`` and the estimator is called for each tile
+            concurrently, accumulating the results of each tile as they complete.
+            If ``None``, the estimator is called once with all the shifted
+            parameters.
+        tile_size: The number of shifted parameters passed to a single call of the
+            estimator when ``executor`` is given.
+        dtype: A complex floating point type used for accumulating the hessian.
+            ``numpy.complex64`` halves the memory traffic of the accumulation, but the
+            estimated expectation values are rounded to single precision before the
+            shifted terms are combined, so the cancellation in the parameter shift
+            rule leaves errors of the order of the single precision epsilon relative
+            to the magnitude of the expectation values.
 
     Returns:
         The estimated values (can be accessed with :attr:`.values`) with errors
         of estimation (can be accessed with :attr:`.error_tensor`). Currently,
         :attr:`.error_tensor` returns `None`.
     """
-    param_circuit = state.parametric_circuit
-    param_mapping = cast(LinearParameterMapping, param_circuit.param_mapping)
-    parameter_shift = ShiftedParameters(param_mapping)
-    derivatives = [
-        derivs_i.get_derivatives() for derivs_i in parameter_shift.get_derivatives()
+    _validate_options(tile_size, dtype)
+    param_mapping = cast(LinearParameterMapping, state.parametric_circuit.param_mapping)
+    return _estimate_hessian(
+        op,
+        state,
+        params,
+        estimator,
+        _get_second_derivatives(param_mapping),
+        executor,
+        tile_size,
+        np.dtype(dtype),
+    )
+
+
+#: Parameter shifts and coefficients of the second order derivatives, which only
+#: depend on the parameter mapping. Only the shifts are stored, since
+#: :class:`ShiftedParameters` refers back to the parameter mapping and would keep the
+#: weakly referenced key (and the circuit) alive.
+_second_derivatives_cache: WeakKeyDictionary[
+    LinearParameterMapping, Sequence[Sequence[Collection[ParameterShiftsAndCoef]]]
+] = WeakKeyDictionary()
+
+
+def _get_second_derivatives(
+    param_mapping: LinearParameterMapping,
+) -> Sequence[Sequence[ShiftedParameters]]:
+    if param_mapping not in _second_derivatives_cache:
+        parameter_shift = ShiftedParameters(param_mapping)
+        _second_derivatives_cache[param_mapping] = [
+            [d.shifts_with_coef for d in derivs_i.get_derivatives()]
+            for derivs_i in parameter_shift.get_derivatives()
+        ]
+    return [
+        [ShiftedParameters(param_mapping, shifts) for shifts in shifts_i]
+        for shifts_i in _second_derivatives_cache[param_mapping]
     ]
+
+
+def _validate_options(tile_size: int, dtype: npt.DTypeLike) -> None:
+    if tile_size < 1:
+        raise ValueError("tile_size must be a positive integer.")
+    if not np.issubdtype(dtype, np.complexfloating):
+        raise ValueError(f"dtype must be a complex floating point type: {dtype}")
+
+
+def _aggregate_coefs(
+    params_and_coefs: Iterable[tuple[Sequence[float], float]]
+) -> Collection[tuple[Sequence[float], float]]:
+    """Merge the terms with the same shifted parameters by summing up their
+    coefficients."""
+    agg: dict[Sequence[float], float] = {}
+    for p, c in params_and_coefs:
+        agg[p] = agg.get(p, 0.0) + c
+    return agg.items()
+
+
+def _estimate_values(
+    estimates: Iterable[Estimate[complex]], count: int, dtype: np.dtype[Any]
+) -> npt.NDArray[Any]:
+    return np.fromiter((e.value for e in estimates), dtype=dtype, count=count)
+
+
+def _estimate_hessian(
+    op: Estimatable,
+    state: _ParametricStateT,
+    params: Sequence[float],
+    estimator: ConcurrentParametricQuantumEstimator[_ParametricStateT],
+    derivatives: Sequence[Sequence[ShiftedParameters]],
+    executor: Optional["Executor"],
+    tile_size: int,
+    dtype: np.dtype[Any],
+) -> MatrixEstimates[complex]:
+    n_params = len(derivatives)
+    # The hessian is symmetric, so only the upper triangle (i <= j) is evaluated.
     shifted_params_and_coeffs_list = [
-        [deriv.get_shifted_parameters_and_coef(params) for deriv in derivs]
-        for derivs in derivatives
+        _aggregate_coefs(derivatives[i][j].get_shifted_parameters_and_coef(params))
+        for i in range(n_params)
+        for j in range(i, n_params)
     ]
     raw_param_state = cast(_ParametricStateT, state.with_primitive_circuit())
-    uniq_g_params = set()
-    for shifted_params_and_coeffs in shifted_params_and_coeffs_list:
-        for params_and_coefs in shifted_params_and_coeffs:
-            for p, _ in params_and_coefs:
-                uniq_g_params.add(p)
-    uniq_g_params_list = list(uniq_g_params)
-
-    # Estimate the expectation values
-    estimates = estimator(op, raw_param_state, uniq_g_params_list)
-    estimates_dict = dict(zip(uniq_g_params_list, estimates))
-
-    # Sum up the expectation values with the coefficients multiplied
-    hessian = np.zeros((len(derivatives), len(derivatives)), dtype=np.complex128)
-    for i in range(len(derivatives)):
-        for j in range(len(derivatives)):
-            g = 0.0 + 0.0j
-            for p, c in shifted_params_and_coeffs_list[i][j]:
-                g += estimates_dict[p].value * c
-            hessian[i, j] = g
+
+    # Lay out the terms of all the upper triangle entries in flat arrays: the terms
+    # of the k-th entry are stored in [offsets[k], offsets[k + 1]) of idx_flat (the
+    # index of the shifted parameters among the unique ones) and coefs_flat.
+    offsets = np.zeros(len(shifted_params_and_coeffs_list) + 1, dtype=np.int64)
+    np.cumsum(
+        [len(params_and_coefs) for params_and_coefs in shifted_params_and_coeffs_list],
+        out=offsets[1:],
+    )
+    n_terms = int(offsets[-1])
+    param_to_idx: dict[Sequence[float], int] = {}
+    idx_flat = np.fromiter(
+        (
+            param_to_idx.setdefault(p, len(param_to_idx))
+            for params_and_coefs in shifted_params_and_coeffs_list
+            for p, _ in params_and_coefs
+        ),
+        dtype=np.int64,
+        count=n_terms,
+    )
+    coefs_flat = np.fromiter(
+        (
+            c
+            for params_and_coefs in shifted_params_and_coeffs_list
+            for _, c in params_and_coefs
+        ),
+        dtype=np.finfo(dtype).dtype,
+        count=n_terms,
+    )
+    uniq_g_params_list = list(param_to_idx)
+
+    # Sum up the expectation values with the coefficients multiplied, as a product
+    # of a sparse coefficient matrix (upper triangle entries x unique parameters)
+    # and the vector of the expectation values. The flat arrays are exactly the CSR
+    # representation of the matrix.
+    coef_matrix = sparse.csr_matrix(
+        (coefs_flat, idx_flat, offsets),
+        shape=(len(shifted_params_and_coeffs_list), len(uniq_g_params_list)),
+    )
+
+    # Estimate the expectation values. When an executor is given, the shifted
+    # parameters are split into tiles estimated concurrently, and the contribution
+    # of each tile is accumulated as soon as its estimates are returned.
+    upper = np.zeros(coef_matrix.shape[0], dtype=dtype)
+    if executor is None:
+        estimates = estimator(op, raw_param_state, uniq_g_params_list)
+        upper += coef_matrix @ _estimate_values(
+            estimates, len(uniq_g_params_list), dtype
+        )
+    else:
+        # Column slices for each tile are cheap in CSC format.
+        coef_matrix = coef_matrix.tocsc()
+        futures = {
+            executor.submit(
+                estimator,
+                op,
+                raw_param_state,
+                uniq_g_params_list[start : start + tile_size],  # noqa: E203
+            ): start
+            for start in range(0, len(uniq_g_params_list), tile_size)
+        }
+        for future in as_completed(futures):
+            start = futures[future]
+            end = min(start + tile_size, len(uniq_g_params_list))
+            values = _estimate_values(future.result(), end - start, dtype)
+            upper += coef_matrix[:, start:end] @ values
+
+    hessian = np.zeros((n_params, n_params), dtype=dtype)
+    triu_indices = np.triu_indices(n_params)
+    hessian[triu_indices] = upper
+    hessian.T[triu_indices] = upper
 
     return _MatrixEstimates(hessian.tolist(), None)
 
 
 def create_parameter_shift_hessian_estimator(
     parametric_estimator: ConcurrentParametricQuantumEstimator[_ParametricStateT],
+    executor: Optional["Executor"] = None,
+    tile_size: int = 256,
+    dtype: npt.DTypeLike = np.complex128,
 ) -> HessianEstimator[_ParametricStateT]:
+    """Create a :class:`HessianEstimator` that estimates hessian values by the
+    parameter shift rule.
+
+    Args:
+        parametric_estimator: An estimator that estimates expectation values
+            of the operator for the parametric states.
+        executor: An optional executor used to estimate tiles of the shifted
+            parameters concurrently. See :func:`parameter_shift_hessian_estimates`.
+        tile_size: The number of shifted parameters passed to a single call of the
+            estimator when ``executor`` is given.
+        dtype: A complex floating point type used for accumulating the hessian.
+            See :func:`parameter_shift_hessian_estimates`.
+    """
+    _validate_options(tile_size, dtype)
+
     def estimator(
         operator: Estimatable, state: _ParametricStateT, params: Sequence[float]
     ) -> MatrixEstimates[complex]:
         return parameter_shift_hessian_estimates(
-            operator, state, params, parametric_estimator
+            operator, state, params, parametric_estimator, executor, tile_size, dtype
         )
 
     return estimator
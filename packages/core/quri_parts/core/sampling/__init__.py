@@ -11,6 +11,7 @@
 from collections import Counter
 from dataclasses import dataclass, field
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Collection,
@@ -18,6 +19,7 @@ from typing import (
     Iterable,
     Mapping,
     NamedTuple,
+    Optional,
     Sequence,
     TypeVar,
     Union,
@@ -42,6 +44,9 @@ from quri_parts.core.state import (
     QuantumStateVector,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 #: A type variable represents *any* non-parametric quantum state classes.
 #: This is different from :class:`quri_parts.core.state.QuantumStateT`;
 #: ``QuantumStateT`` represents *either one of* the classes, while ``_StateT`` also
@@ -435,44 +440,131 @@ def create_concurrent_parametric_state_sampler_from_concurrent_state_sampler(
 def sample_from_probibility_distribution(
     n_sample: int,
     probibility_distribution: Union[Sequence[float], npt.NDArray[np.float64]],
+    seed: Optional[int] = None,
 ) -> MeasurementCounts:
-    """Sample from a probibility distribution."""
-    rng = np.random.default_rng()
+    """Sample from a probibility distribution.
+
+    All the counts are drawn at once from a multinomial distribution. ``seed`` is
+    used to initialize NumPy's default_rng.
+    """
+    rng = np.random.default_rng(seed)
     rounded_prob = np.round(probibility_distribution, 12)
     norm = np.sum(rounded_prob)
     assert np.isclose(norm, 1.0), "Probabilty does not sum to 1.0"
     rounded_prob = rounded_prob / norm
     counts = rng.multinomial(n_sample, rounded_prob)
-    return Counter(dict(((i, count) for i, count in enumerate(counts) if count > 0)))
+    observed = np.flatnonzero(counts)
+    return Counter(dict(zip(observed.tolist(), counts[observed].tolist())))
 
 
 def sample_from_state_vector(
-    state_vector: npt.NDArray[np.complex128], n_shots: int
+    state_vector: npt.NDArray[np.complex128],
+    n_shots: int,
+    seed: Optional[int] = None,
 ) -> MeasurementCounts:
-    """Perform sampling from a state vector."""
+    """Perform sampling from a state vector.
+
+    ``seed`` is used to initialize NumPy's default_rng.
+    """
     n_qubits: float = np.log2(state_vector.shape[0])
     assert n_qubits.is_integer(), "Length of the state vector must be a power of 2."
-    if not np.isclose(np.linalg.norm(state_vector), 1):
+    probs = cast(npt.NDArray[np.float64], np.abs(state_vector))
+    probs *= probs
+    if not np.isclose(np.sum(probs), 1):
         raise ValueError("probabilities do not sum to 1")
-    probs = cast(npt.NDArray[np.float64], np.abs(state_vector) ** 2)
-    return sample_from_probibility_distribution(n_shots, probs)
+    return sample_from_probibility_distribution(n_shots, probs, seed)
+
+
+class StateVectorSampler:
+    """A sampler that repeatedly samples from a fixed state vector.
+
+    The probability distribution of the state vector is preprocessed into
+    alias tables (Vose's alias method) on construction, so that each shot of
+    :meth:`sample` is drawn in constant time. This is suitable for sampling
+    from the same state vector many times, while
+    :func:`sample_from_state_vector` is suitable for a single sampling.
+
+    Args:
+        state_vector: A state vector to be sampled.
+        seed: Seed used to initialize NumPy's default_rng.
+    """
+
+    def __init__(
+        self, state_vector: npt.NDArray[np.complex128], seed: Optional[int] = None
+    ):
+        n_qubits: float = np.log2(state_vector.shape[0])
+        assert n_qubits.is_integer(), "Length of the state vector must be a power of 2."
+        probs = np.abs(state_vector) ** 2
+        if not np.isclose(np.sum(probs), 1):
+            raise ValueError("probabilities do not sum to 1")
+
+        self._dim = len(probs)
+        self._prob_table, self._alias_table = _build_alias_tables(probs / np.sum(probs))
+        self._rng = np.random.default_rng(seed)
+
+    def sample(self, n_shots: int) -> MeasurementCounts:
+        """Perform sampling from the state vector by ``n_shots`` times."""
+        k = self._rng.integers(0, self._dim, size=n_shots)
+        u = self._rng.random(n_shots)
+        idx = np.where(u < self._prob_table[k], k, self._alias_table[k])
+        counts = np.bincount(idx, minlength=self._dim)
+        observed = np.flatnonzero(counts)
+        return Counter(dict(zip(observed.tolist(), counts[observed].tolist())))
+
+
+def _build_alias_tables(
+    probs: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+    n = len(probs)
+    scaled = probs * n
+    prob_table = np.ones(n, dtype=np.float64)
+    alias_table = np.arange(n, dtype=np.int64)
+
+    small = np.flatnonzero(scaled < 1.0).tolist()
+    large = np.flatnonzero(scaled >= 1.0).tolist()
+    scaled_list = scaled.tolist()
+    while small and large:
+        i, j = small.pop(), large.pop()
+        prob_table[i] = scaled_list[i]
+        alias_table[i] = j
+        scaled_list[j] = scaled_list[j] + scaled_list[i] - 1.0
+        if scaled_list[j] < 1.0:
+            small.append(j)
+        else:
+            large.append(j)
+    # The remaining entries have probability 1 up to numerical errors, which are
+    # already set as the initial values of the tables.
+    return prob_table, alias_table
 
 
 def ideal_sample_from_state_vector(
     state_vector: npt.NDArray[np.complex128], n_shots: int
 ) -> MeasurementCounts:
-    """Perform ideal sampling from a state vector."""
-    n_qubits: float = np.log2(state_vector.shape[0])
-    assert n_qubits.is_integer(), "Length of the state vector must be a power of 2."
-    if not np.isclose(np.linalg.norm(state_vector), 1):
+    """Perform ideal sampling from a state vector.
+
+    Only the bit patterns with non-zero probabilities are contained in the
+    returned counts.
+    """
+    dim = state_vector.shape[0]
+    assert (
+        dim > 0 and dim & (dim - 1) == 0
+    ), "Length of the state vector must be a power of 2."
+    probs = np.abs(state_vector)
+    probs *= probs
+    if not np.isclose(np.sum(probs), 1):
         raise ValueError("probabilities do not sum to 1")
 
-    probs = np.abs(state_vector) ** 2
-    return {i: prob * n_shots for i, prob in enumerate(probs)}
+    # Scale the probabilities in place to avoid allocating another array.
+    counts = probs
+    counts *= n_shots
+    observed = np.flatnonzero(counts)
+    return dict(zip(observed.tolist(), counts[observed].tolist()))
 
 
 def sample_from_density_matrix(
-    density_matrix: npt.NDArray[np.complex128], n_shots: int
+    density_matrix: npt.NDArray[np.complex128],
+    n_shots: int,
+    seed: Optional[int] = None,
 ) -> MeasurementCounts:
     assert (
         density_matrix.ndim == 2
@@ -485,7 +577,7 @@ def sample_from_density_matrix(
         raise ValueError("probabilities do not sum to 1")
 
     probs = np.diag(density_matrix).real
-    return sample_from_probibility_distribution(n_shots, probs)
+    return sample_from_probibility_distribution(n_shots, probs, seed)
 
 
 def ideal_sample_from_density_matrix(
@@ -517,17 +609,33 @@ def create_sampler_from_sampling_backend(backend: SamplingBackend) -> Sampler:
 
 def create_concurrent_sampler_from_sampling_backend(
     backend: SamplingBackend,
+    executor: Optional["Executor"] = None,
 ) -> ConcurrentSampler:
     """Create a simple :class:`~ConcurrentSampler` using a
-    :class:`~SamplingBackend`."""
+    :class:`~SamplingBackend`.
+
+    If executor is None, the sampling jobs are submitted to the backend in
+    sequence. If an executor is given, the jobs are submitted concurrently with
+    it, which is useful for backends whose job submission blocks (e.g. on network
+    communication). In both cases the results are returned in the order of the
+    inputs, and each result can be consumed as soon as its job finishes.
+    """
 
     def sampler(
         shot_circuit_pairs: Iterable[tuple[ImmutableQuantumCircuit, int]]
     ) -> Iterable[MeasurementCounts]:
-        jobs = [
-            backend.sample(circuit, n_shots) for circuit, n_shots in shot_circuit_pairs
+        if executor is None:
+            jobs = [
+                backend.sample(circuit, n_shots)
+                for circuit, n_shots in shot_circuit_pairs
+            ]
+            return map(lambda j: j.result().counts, jobs)
+
+        futures = [
+            executor.submit(backend.sample, circuit, n_shots)
+            for circuit, n_shots in shot_circuit_pairs
         ]
-        return map(lambda j: j.result().counts, jobs)
+        return map(lambda f: f.result().result().counts, futures)
 
     return sampler
 
@@ -8,6 +8,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import Any
 from unittest import mock
 
 from quri_parts.backend import CompositeSamplingJob, SamplingCounts
@@ -20,6 +23,18 @@ def create_mock_job(counts: SamplingCounts) -> mock.Mock:
     return job
 
 
+def create_blocking_mock_job(counts: SamplingCounts, barrier: Barrier) -> mock.Mock:
+    job = create_mock_job(counts)
+    result = job.result.return_value
+
+    def wait_result() -> Any:
+        barrier.wait()
+        return result
+
+    job.result.side_effect = wait_result
+    return job
+
+
 def test_composite_sampling_job() -> None:
     counts = [
         {0: 100, 1: 200, 2: 300, 3: 400},
@@ -28,3 +43,37 @@ def test_composite_sampling_job() -> None:
     jobs = [create_mock_job(c) for c in counts]
     composite_job = CompositeSamplingJob(jobs=jobs)
     assert composite_job.result().counts == {0: 300, 1: 600, 2: 300, 3: 500, 4: 500}
+
+
+def test_composite_sampling_job_non_positive_counts() -> None:
+    counts = [{0: -3.0, 1: 2.0}, {0: 5.0, 1: -2.0}]
+    composite_job = CompositeSamplingJob(jobs=[create_mock_job(c) for c in counts])
+    assert composite_job.result().counts == {0: 5.0}
+
+
+def test_composite_sampling_job_single() -> None:
+    counts = {0: 100, 1: 200, 2: 300, 3: 400}
+    composite_job = CompositeSamplingJob(jobs=[create_mock_job(counts)])
+    assert composite_job.result().counts == counts
+
+
+def test_composite_sampling_job_with_executor() -> None:
+    counts = [
+        {0: 100, 1: 200, 2: 300, 3: 400},
+        {0: 200, 1: 400, 3: 100, 4: 500},
+    ]
+    # Each result() call blocks until all the jobs are waited for at the same time.
+    barrier = Barrier(len(counts), timeout=5.0)
+    jobs = [create_blocking_mock_job(c, barrier) for c in counts]
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        composite_job = CompositeSamplingJob(jobs=jobs, executor=executor)
+        assert composite_job.result().counts == {
+            0: 300,
+            1: 600,
+            2: 300,
+            3: 500,
+            4: 500,
+        }
+    for job in jobs:
+        job.result.assert_called_once()
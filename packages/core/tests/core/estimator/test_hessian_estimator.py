@@ -8,7 +8,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from typing import Sequence
 
 import numpy as np
@@ -19,7 +21,10 @@ from quri_parts.circuit import (
     ParametricQuantumCircuit,
 )
 from quri_parts.core.estimator import Estimatable, MatrixEstimates, _ParametricStateT
-from quri_parts.core.estimator.hessian import create_parameter_shift_hessian_estimator
+from quri_parts.core.estimator.hessian import (
+    _second_derivatives_cache,
+    create_parameter_shift_hessian_estimator,
+)
 from quri_parts.core.operator import PAULI_IDENTITY, Operator, pauli_label
 from quri_parts.core.state import ParametricCircuitQuantumState
 from quri_parts.qulacs.estimator import (
@@ -144,3 +149,85 @@ class TestParameterShiftHessianEstimateLinearMappedState(unittest.TestCase):
         hessian_matrix = self.hessian_estimator(operator, self.state, params)
         expected = [[0, 0], [0, 0]]
         assert np.allclose(hessian_matrix.values, expected)
+
+    def test_repeated_hessian(self) -> None:
+        operator = Operator({pauli_label("Z0 Z1"): 2.0, pauli_label("Z2"): 3.0})
+        parametric_estimator = create_qulacs_vector_concurrent_parametric_estimator()
+        estimator = create_parameter_shift_hessian_estimator(parametric_estimator)
+
+        for params in ([np.pi / 3, np.pi / 7], [np.pi / 5, -np.pi / 2]):
+            hessian_matrix = estimator(operator, self.state, params)
+            expected = self.hessian_estimator(operator, self.state, params)
+            assert np.allclose(hessian_matrix.values, expected.values)
+
+    def test_second_derivatives_cache_released(self) -> None:
+        operator = Operator({pauli_label("Z0 Z1"): 2.0})
+        parametric_estimator = create_qulacs_vector_concurrent_parametric_estimator()
+        estimator = create_parameter_shift_hessian_estimator(parametric_estimator)
+
+        n_cached = len(_second_derivatives_cache)
+        param_circuit = LinearMappedParametricQuantumCircuit(2)
+        theta = param_circuit.add_parameter("theta")
+        param_circuit.add_ParametricRX_gate(0, {theta: 1.0})
+        param_circuit.add_ParametricRY_gate(1, {theta: 0.5})
+        state = ParametricCircuitQuantumState(2, param_circuit)
+        estimator(operator, state, [np.pi / 3])
+        assert len(_second_derivatives_cache) == n_cached + 1
+
+        del state, param_circuit
+        gc.collect()
+        assert len(_second_derivatives_cache) == n_cached
+
+    def test_hessian_with_executor(self) -> None:
+        operator = Operator(
+            {
+                PAULI_IDENTITY: 1.0,
+                pauli_label("Z0"): 4.0,
+                pauli_label("Z1"): 3.0 * 3**2,
+                pauli_label("Z2"): 4.0 * 4**3,
+                pauli_label("Z0 Z1"): 5.0 * (5 - 1),
+                pauli_label("Z0 Z2"): 6.0,
+            }
+        )
+        parametric_estimator = create_qulacs_vector_concurrent_parametric_estimator()
+
+        params = [np.pi / 3, np.pi / 7]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            estimator = create_parameter_shift_hessian_estimator(
+                parametric_estimator, executor=executor, tile_size=3
+            )
+            hessian_matrix = estimator(operator, self.state, params)
+        expected = [[-8.25677, -1.72578], [-1.72578, 38.6785]]
+        assert np.allclose(hessian_matrix.values, expected)
+
+    def test_hessian_single_precision(self) -> None:
+        operator = Operator(
+            {
+                PAULI_IDENTITY: 1.0,
+                pauli_label("Z0"): 4.0,
+                pauli_label("Z1"): 3.0 * 3**2,
+                pauli_label("Z2"): 4.0 * 4**3,
+                pauli_label("Z0 Z1"): 5.0 * (5 - 1),
+                pauli_label("Z0 Z2"): 6.0,
+            }
+        )
+        parametric_estimator = create_qulacs_vector_concurrent_parametric_estimator()
+        estimator = create_parameter_shift_hessian_estimator(
+            parametric_estimator, dtype=np.complex64
+        )
+
+        params = [np.pi / 3, np.pi / 7]
+        hessian_matrix = estimator(operator, self.state, params)
+        expected = self.hessian_estimator(operator, self.state, params)
+        # The estimates are rounded to single precision before the shifted terms
+        # cancel each other, so only a single precision tolerance holds.
+        assert np.allclose(hessian_matrix.values, expected.values, rtol=1e-4)
+
+    def test_invalid_options(self) -> None:
+        parametric_estimator = create_qulacs_vector_concurrent_parametric_estimator()
+        with self.assertRaises(ValueError):
+            create_parameter_shift_hessian_estimator(
+                parametric_estimator, dtype=np.float64
+            )
+        with self.assertRaises(ValueError):
+            create_parameter_shift_hessian_estimator(parametric_estimator, tile_size=0)
@@ -10,6 +10,7 @@
 
 import re
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 from unittest import TestCase, mock
 
@@ -495,3 +496,29 @@ def test_create_concurrent_sampler_from_sampling_backend() -> None:
         mock.call(circuits[0], 1000),
         mock.call(circuits[1], 900),
     ]
+
+
+def test_create_concurrent_sampler_from_sampling_backend_with_executor() -> None:
+    circuits = [QuantumCircuit(3), QuantumCircuit(2), QuantumCircuit(1)]
+    counts = {
+        1000: {0: 100, 1: 200, 2: 300, 3: 400},
+        900: {0: 300, 1: 300, 2: 200, 3: 100},
+        800: {0: 800},
+    }
+
+    def sample(circuit: NonParametricQuantumCircuit, n_shots: int) -> mock.Mock:
+        job = mock.Mock()
+        job.result.return_value.counts = counts[n_shots]
+        return job
+
+    backend = mock.Mock()
+    backend.sample.side_effect = sample
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sampler = create_concurrent_sampler_from_sampling_backend(backend, executor)
+        sampling_results = sampler(
+            [(circuits[0], 1000), (circuits[1], 900), (circuits[2], 800)]
+        )
+        assert list(sampling_results) == list(counts.values())
+
+    assert backend.sample.call_count == 3
@@ -14,6 +14,7 @@ import numpy as np
 import pytest
 
 from quri_parts.core.sampling import (
+    StateVectorSampler,
     ideal_sample_from_state_vector,
     sample_from_state_vector,
 )
@@ -28,6 +29,12 @@ class TestSampleFromStateVector:
             state[i] = np.exp(1j * phase)
             assert sample_from_state_vector(state, 1000) == Counter({i: 1000})
 
+    def test_sample_with_seed(self) -> None:
+        state = np.ones(8, dtype=np.complex128) / np.sqrt(8)
+        cnts = sample_from_state_vector(state, 1000, seed=1)
+        assert sum(cnts.values()) == 1000
+        assert sample_from_state_vector(state, 1000, seed=1) == cnts
+
     def test_invalid_input(self) -> None:
         with pytest.raises(
             AssertionError, match="Length of the state vector must be a power of 2."
@@ -42,6 +49,43 @@ class TestSampleFromStateVector:
             )
 
 
+class TestStateVectorSampler:
+    def test_sample(self) -> None:
+        n_qubits = 2
+        for i in range(2**n_qubits):
+            phase = np.random.random()
+            state = np.zeros(2**n_qubits, dtype=np.complex128)
+            state[i] = np.exp(1j * phase)
+            sampler = StateVectorSampler(state)
+            assert sampler.sample(1000) == Counter({i: 1000})
+            assert sampler.sample(10) == Counter({i: 10})
+
+    def test_sample_distribution(self) -> None:
+        state_vector = np.array(
+            [
+                0.13106223 + 0.70435299j,
+                0.16605566 - 0.36973591j,
+                0.10202236 + 0.48950168j,
+                0.18068102 - 0.19940998j,
+            ]
+        )
+        sampler = StateVectorSampler(state_vector, seed=1)
+        n_shots = 100000
+        counts = sampler.sample(n_shots)
+        assert sum(counts.values()) == n_shots
+        for i, prob in enumerate(np.abs(state_vector) ** 2):
+            assert np.isclose(counts[i] / n_shots, prob, atol=0.01)
+
+    def test_invalid_input(self) -> None:
+        with pytest.raises(
+            AssertionError, match="Length of the state vector must be a power of 2."
+        ):
+            StateVectorSampler(np.array([0.5, 0.1, np.sqrt(1 - 0.25 - 0.01)]))
+
+        with pytest.raises(ValueError, match="probabilities do not sum to 1"):
+            StateVectorSampler(np.random.random(4) + 1j * np.random.random(4))
+
+
 class TestIdealSampleFromStateVector:
     def test_ideal_sample_from_state_vector(self) -> None:
         n_qubits = 2
@@ -62,6 +106,15 @@ class TestIdealSampleFromStateVector:
             assert np.isclose(sampled_cnt[i], expected_cnt[i])
         assert np.isclose(sum(expected_cnt.values()), 1000)
 
+    def test_ideal_sample_from_sparse_state_vector(self) -> None:
+        state_vector = np.zeros(8, dtype=np.complex128)
+        state_vector[[1, 6]] = [1j / np.sqrt(2), 1 / np.sqrt(2)]
+        sampled_cnt = ideal_sample_from_state_vector(state_vector, 1000)
+
+        assert sampled_cnt.keys() == {1, 6}
+        assert np.isclose(sampled_cnt[1], 500)
+        assert np.isclose(sampled_cnt[6], 500)
+
     def test_invalid_input(self) -> None:
         with pytest.raises(
             AssertionError, match="Length of the state vector must be a power of 2."
@@ -11,13 +11,18 @@
 from collections.abc import Mapping, Sequence
 from typing import Callable, Union, cast
 
+import numpy as np
 import qulacs
+import scipy.sparse as sparse
 from numpy.typing import ArrayLike
 from typing_extensions import assert_never
 
 from quri_parts.circuit import (
+    CONST,
     ImmutableLinearMappedParametricQuantumCircuit,
     ImmutableParametricQuantumCircuit,
+    LinearParameterMapping,
+    Parameter,
     ParametricQuantumCircuitProtocol,
     QuantumGate,
     gate_names,
@@ -191,6 +196,53 @@ def convert_gate(
         assert False, "Unreachable"
 
 
+def _negated_linear_param_mapper(
+    param_mapping: LinearParameterMapping,
+) -> Callable[[Sequence[float]], Sequence[float]]:
+    """Returns a function mapping input parameter values to negated output
+    parameter values of the given linear mapping.
+
+    The affine mapping is materialized once as a sparse matrix and a bias
+    vector (with the sign flip folded in), so that each call is a single
+    sparse matrix-vector product.
+    """
+    in_params = param_mapping.in_params
+    out_params = param_mapping.out_params
+    in_param_idx = {p: i for i, p in enumerate(in_params)}
+
+    rows: list[int] = []
+    cols: list[int] = []
+    coefs: list[float] = []
+    bias = np.zeros(len(out_params))
+    for row, out_param in enumerate(out_params):
+        fn = param_mapping.mapping[out_param]
+        if isinstance(fn, Parameter):
+            rows.append(row)
+            cols.append(in_param_idx[fn])
+            coefs.append(-1.0)
+            continue
+        for p, c in fn.items():
+            if p == CONST:
+                bias[row] = -c
+            else:
+                rows.append(row)
+                cols.append(in_param_idx[p])
+                coefs.append(-c)
+    matrix = sparse.csr_matrix(
+        (coefs, (rows, cols)), shape=(len(out_params), len(in_params))
+    )
+
+    def param_mapper(s: Sequence[float]) -> Sequence[float]:
+        if len(s) != len(in_params):
+            raise ValueError(
+                f"Passed value count ({len(s)}) does not match parameter "
+                f"count ({len(in_params)})."
+            )
+        return tuple((matrix @ np.asarray(s, dtype=np.float64) + bias).tolist())
+
+    return param_mapper
+
+
 def convert_parametric_circuit(
     circuit: ParametricQuantumCircuitProtocol,
 ) -> tuple[
@@ -199,12 +251,8 @@ def convert_parametric_circuit(
     param_circuit: ImmutableParametricQuantumCircuit
     param_mapper: Callable[[Sequence[float]], Sequence[float]]
     if isinstance(circuit, ImmutableLinearMappedParametricQuantumCircuit):
-        param_mapping = circuit.param_mapping
         param_circuit = circuit.primitive_circuit()
-        orig_param_mapper = param_mapping.seq_mapper
-
-        def param_mapper(s: Sequence[float]) -> Sequence[float]:
-            return tuple(-p for p in orig_param_mapper(s))
+        param_mapper = _negated_linear_param_mapper(circuit.param_mapping)
 
     elif isinstance(circuit, ImmutableParametricQuantumCircuit):
         param_circuit = circuit
@@ -8,8 +8,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import cast
-
 import numpy as np
 import qulacs
 
@@ -38,8 +36,8 @@ def gates_equal(g1: qulacs.QuantumGateBase, g2: qulacs.QuantumGateBase) -> bool:
             g.get_control_index_list(),
         )
 
-    return (gate_info(g1) == gate_info(g2)) and cast(
-        bool, np.all(g1.get_matrix() == g2.get_matrix())
+    return (gate_info(g1) == gate_info(g2)) and np.array_equal(
+        g1.get_matrix(), g2.get_matrix()
     )
 
 
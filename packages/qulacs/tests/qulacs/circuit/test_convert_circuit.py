@@ -9,12 +9,14 @@
 # limitations under the License.
 
 from collections.abc import Mapping
-from typing import Callable, cast
+from typing import Callable
 
 import numpy as np
+import pytest
 import qulacs
 
 from quri_parts.circuit import (
+    CONST,
     LinearMappedParametricQuantumCircuit,
     ParametricQuantumCircuit,
     QuantumCircuit,
@@ -45,8 +47,8 @@ def gates_equal(g1: qulacs.QuantumGateBase, g2: qulacs.QuantumGateBase) -> bool:
             g.get_control_index_list(),
         )
 
-    return (gate_info(g1) == gate_info(g2)) and cast(
-        bool, np.all(g1.get_matrix() == g2.get_matrix())
+    return (gate_info(g1) == gate_info(g2)) and np.array_equal(
+        g1.get_matrix(), g2.get_matrix()
     )
 
 
@@ -279,6 +281,19 @@ def test_convert_linear_mapped_parametric_circuit() -> None:
         assert gates_equal(converted.get_gate(i), expected)
 
 
+def test_convert_linear_mapped_parametric_circuit_with_const() -> None:
+    circuit = LinearMappedParametricQuantumCircuit(2)
+    theta, phi = circuit.add_parameters("theta", "phi")
+    circuit.add_ParametricRX_gate(0, {theta: 0.5, phi: 2.0, CONST: 0.25})
+    circuit.add_ParametricRY_gate(1, {CONST: -1.0, phi: 1.0})
+
+    _, param_mapper = convert_parametric_circuit(circuit)
+    assert param_mapper((2.0, 0.5)) == (-2.25, 0.5)
+
+    with pytest.raises(ValueError):
+        param_mapper((2.0,))
+
+
 def test_evaluate_2qubit_unitary_matrix_gate() -> None:
     umat = [
         [
@@ -8,7 +8,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections.abc import Mapping, Sequence
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping, Sequence
 from typing import Optional
 
 from pytket import OpType, passes
@@ -70,6 +71,12 @@ class TketTranspiler(CircuitTranspilerProtocol):
         basis_gates: Specify the gate set after decomposition as a list of gate name
             strings.
         optimization_level: Specifies the optimization level of the circuit from 0 to 3.
+        cache_size: The maximum number of transpiled circuits kept in the cache.
+            Transpiling a circuit identical (including the gate parameters) to a
+            cached one returns the cached result without invoking Tket. Setting 0
+            disables the cache. The transpiled circuits are returned frozen
+            (as :class:`ImmutableQuantumCircuit`) whether or not the cache is
+            enabled, since cached results are shared between calls.
 
     Refs:
         https://cqcl.github.io/pytket/manual/manual_compiler.html
@@ -80,25 +87,47 @@ class TketTranspiler(CircuitTranspilerProtocol):
         backend: Optional[Backend] = None,
         basis_gates: Optional[Sequence[GateNameType]] = None,
         optimization_level: int = 3,
+        cache_size: int = 128,
     ):
         if not (0 <= optimization_level <= 3):
             raise ValueError("optimization_level must be 0 to 3.")
+        if cache_size < 0:
+            raise ValueError("cache_size must be a non-negative integer.")
 
-        self._basis_gates: Optional[set[str]] = None
-        if basis_gates is not None:
-            self._basis_gates = {_qp_tket_gate_name_map[name] for name in basis_gates}
+        self._basis_gates: Optional[frozenset[OpType]] = (
+            None
+            if basis_gates is None
+            else frozenset(_qp_tket_gate_name_map[name] for name in basis_gates)
+        )
 
         self._backend = backend
         self._optimization_level = optimization_level
+        self._cache_size = cache_size
+        self._cache: OrderedDict[Hashable, ImmutableQuantumCircuit] = OrderedDict()
 
     def __call__(self, circuit: ImmutableQuantumCircuit) -> ImmutableQuantumCircuit:
+        if self._cache_size == 0:
+            return self._transpile(circuit)
+
+        key = (circuit.qubit_count, circuit.cbit_count, tuple(circuit.gates))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        transpiled = self._transpile(circuit)
+        self._cache[key] = transpiled
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return transpiled
+
+    def _transpile(self, circuit: ImmutableQuantumCircuit) -> ImmutableQuantumCircuit:
         tket_circ = convert_circuit(circuit)
 
         if self._backend is not None:
             self._backend.default_compilation_pass(
                 optimisation_level=self._optimization_level
             ).apply(tket_circ)
-            return circuit_from_tket(tket_circ)
+            return circuit_from_tket(tket_circ).freeze()
 
         pass_list = []
         if self._optimization_level == 1:
@@ -107,10 +136,10 @@ class TketTranspiler(CircuitTranspilerProtocol):
             pass_list.append(passes.FullPeepholeOptimise())  # type: ignore
 
         if self._basis_gates is not None:
-            pass_list.append(passes.auto_rebase_pass(self._basis_gates))
+            pass_list.append(passes.auto_rebase_pass(set(self._basis_gates)))
 
         passes.SequencePass(pass_list).apply(tket_circ)  # type: ignore
-        return circuit_from_tket(tket_circ)
+        return circuit_from_tket(tket_circ).freeze()
 
 
 __all__ = [
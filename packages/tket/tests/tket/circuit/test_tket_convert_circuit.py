@@ -8,13 +8,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections.abc import Mapping
-from typing import Callable, Sequence, Type, cast
+import cmath
+import math
+from typing import Callable, Final, Sequence, cast
 
 import numpy as np
+import numpy.typing as npt
+import pytest
 from pytket import Circuit, OpType, Qubit
 from pytket.circuit import Unitary1qBox, Unitary2qBox, Unitary3qBox  # type: ignore
-from scipy.stats import unitary_group
 
 from quri_parts.circuit import QuantumCircuit, QuantumGate, gates
 from quri_parts.tket.circuit import convert_circuit
@@ -22,10 +24,10 @@ from quri_parts.tket.circuit import convert_circuit
 
 def circuit_equal(c1: Circuit, c2: Circuit) -> bool:
     def qubits_to_idx_list(qubits: Sequence[Qubit]) -> list[int]:
-        get_index_number_from_qubit: Callable[[Qubit], int] = lambda qubit: cast(
-            int, qubit.index[0]
-        )
-        return list(map(get_index_number_from_qubit, qubits))
+        return [qubit.index[0] for qubit in qubits]
+
+    if c1.n_qubits != c2.n_qubits or c1.n_gates != c2.n_gates:
+        return False
 
     for gate1, gate2 in zip(c1, c2):
         qubits_same = qubits_to_idx_list(gate1.qubits) == qubits_to_idx_list(
@@ -45,7 +47,7 @@ def circuit_equal(c1: Circuit, c2: Circuit) -> bool:
                 and isinstance(gate2.op, Unitary3qBox)
             )
         ):
-            matrix_same = np.allclose(gate1.op.get_unitary(), gate2.op.get_unitary())
+            matrix_same = np.array_equal(gate1.op.get_unitary(), gate2.op.get_unitary())
 
             if not matrix_same:
                 return False
@@ -59,7 +61,21 @@ def circuit_equal(c1: Circuit, c2: Circuit) -> bool:
     return True
 
 
-single_qubit_gate_mapping: Mapping[Callable[[int], QuantumGate], OpType] = {
+def _assert_converts(
+    n_qubit: int,
+    qp_gates: Sequence[QuantumGate],
+    tket_build: Callable[[Circuit], Circuit],
+) -> None:
+    qp_circuit = QuantumCircuit(n_qubit)
+    for gate in qp_gates:
+        qp_circuit.add_gate(gate)
+
+    converted = convert_circuit(qp_circuit)
+    expected = tket_build(Circuit(n_qubit))
+    assert converted == expected
+
+
+single_qubit_gate_mapping: Final[dict[Callable[[int], QuantumGate], OpType]] = {
     gates.Identity: OpType.noop,
     gates.X: OpType.X,
     gates.Y: OpType.Y,
@@ -74,179 +90,166 @@ single_qubit_gate_mapping: Mapping[Callable[[int], QuantumGate], OpType] = {
 }
 
 
-def test_convert_single_qubit_gate() -> None:
-    for qp_factory, tket_gate in single_qubit_gate_mapping.items():
-        target_index = 7
-        n_qubit = 8
+@pytest.mark.parametrize(
+    "qp_factory, tket_gate", list(single_qubit_gate_mapping.items())
+)
+def test_convert_single_qubit_gate(
+    qp_factory: Callable[[int], QuantumGate], tket_gate: OpType
+) -> None:
+    _assert_converts(1, [qp_factory(0)], lambda c: c.add_gate(tket_gate, [0]))
+
 
-        qp_gate = qp_factory(target_index)
-        qp_circuit = QuantumCircuit(n_qubit)
-        qp_circuit.add_gate(qp_gate)
+def test_convert_all_single_qubit_gates() -> None:
+    n_qubit = len(single_qubit_gate_mapping)
 
-        tket_circuit = Circuit(n_qubit)
+    qp_circuit = QuantumCircuit(n_qubit)
+    tket_circuit = Circuit(n_qubit)
+    for target_index, (qp_factory, tket_gate) in enumerate(
+        single_qubit_gate_mapping.items()
+    ):
+        qp_circuit.add_gate(qp_factory(target_index))
         tket_circuit.add_gate(tket_gate, [target_index])
 
-        converted = convert_circuit(qp_circuit)
-        expected = tket_circuit
-        assert circuit_equal(converted, expected)
+    converted = convert_circuit(qp_circuit)
+    expected = tket_circuit
+    assert converted == expected
 
 
-single_qubit_sqrt_y_gate_mapping: Mapping[
-    Callable[[int], QuantumGate], Unitary1qBox
+single_qubit_sqrt_y_gate_mapping: Final[
+    dict[Callable[[int], QuantumGate], Unitary1qBox]
 ] = {
     gates.SqrtY: Unitary1qBox(
-        np.array([[0.5 + 0.5j, -0.5 - 0.5j], [0.5 + 0.5j, 0.5 + 0.5j]])
+        np.array(
+            [[0.5 + 0.5j, -0.5 - 0.5j], [0.5 + 0.5j, 0.5 + 0.5j]],
+            dtype=np.complex64,
+        )
     ),
     gates.SqrtYdag: Unitary1qBox(
-        np.array([[0.5 - 0.5j, 0.5 - 0.5j], [-0.5 + 0.5j, 0.5 - 0.5j]])
+        np.array(
+            [[0.5 - 0.5j, 0.5 - 0.5j], [-0.5 + 0.5j, 0.5 - 0.5j]],
+            dtype=np.complex64,
+        )
     ),
 }
 
 
-def test_convert_single_qubit_sgate() -> None:
-    for qp_factory, tket_gate in single_qubit_sqrt_y_gate_mapping.items():
-        target_index = 7
-        n_qubit = 8
+@pytest.mark.parametrize(
+    "qp_factory, tket_gate", list(single_qubit_sqrt_y_gate_mapping.items())
+)
+def test_convert_single_qubit_sgate(
+    qp_factory: Callable[[int], QuantumGate], tket_gate: Unitary1qBox
+) -> None:
+    target_index = 0
+    n_qubit = 1
 
-        qp_gate = qp_factory(target_index)
-        qp_circuit = QuantumCircuit(n_qubit)
-        qp_circuit.add_gate(qp_gate)
+    qp_gate = qp_factory(target_index)
+    qp_circuit = QuantumCircuit(n_qubit)
+    qp_circuit.add_gate(qp_gate)
 
-        tket_circuit = Circuit(n_qubit)
-        tket_circuit.add_unitary1qbox(tket_gate, target_index)
+    tket_circuit = Circuit(n_qubit)
+    tket_circuit.add_unitary1qbox(tket_gate, target_index)
 
-        converted = convert_circuit(qp_circuit)
-        expected = tket_circuit
-        assert circuit_equal(converted, expected)
+    converted = convert_circuit(qp_circuit)
+    expected = tket_circuit
+    assert circuit_equal(converted, expected)
 
 
-rotation_gate_mapping: Mapping[Callable[[int, float], QuantumGate], Type[OpType]] = {
+rotation_gate_mapping: Final[dict[Callable[[int, float], QuantumGate], OpType]] = {
     gates.RX: OpType.Rx,
     gates.RY: OpType.Ry,
     gates.RZ: OpType.Rz,
 }
 
 
-def test_convert_rotation_gate() -> None:
-    for qp_factory, tket_gate in rotation_gate_mapping.items():
-        target_index = 7
-        n_qubit = 8
-
-        qp_gate = qp_factory(7, 0.125)
-        qp_circuit = QuantumCircuit(n_qubit)
-        qp_circuit.add_gate(qp_gate)
-
-        tket_circuit = Circuit(n_qubit)
-        tket_circuit.add_gate(tket_gate, 0.125 / np.pi, [target_index])
-
-        converted = convert_circuit(qp_circuit)
-        expected = tket_circuit
-        assert circuit_equal(converted, expected)
+@pytest.mark.parametrize("qp_factory, tket_gate", list(rotation_gate_mapping.items()))
+def test_convert_rotation_gate(
+    qp_factory: Callable[[int, float], QuantumGate], tket_gate: OpType
+) -> None:
+    _assert_converts(
+        1, [qp_factory(0, 0.125)], lambda c: c.add_gate(tket_gate, 0.125 / np.pi, [0])
+    )
 
 
-two_qubit_gate_mapping: Mapping[Callable[[int, int], QuantumGate], OpType] = {
+two_qubit_gate_mapping: Final[dict[Callable[[int, int], QuantumGate], OpType]] = {
     gates.CNOT: OpType.CX,
     gates.CZ: OpType.CZ,
     gates.SWAP: OpType.SWAP,
 }
 
 
-def test_convert_two_qubit_gate() -> None:
-    for qp_factory, tket_gate in two_qubit_gate_mapping.items():
-        target_index = 7
-        control_index = 4
-        n_qubit = 8
+@pytest.mark.parametrize("qp_factory, tket_gate", list(two_qubit_gate_mapping.items()))
+def test_convert_two_qubit_gate(
+    qp_factory: Callable[[int, int], QuantumGate], tket_gate: OpType
+) -> None:
+    _assert_converts(2, [qp_factory(0, 1)], lambda c: c.add_gate(tket_gate, [0, 1]))
 
-        qp_gate = qp_factory(control_index, target_index)
-        qp_circuit = QuantumCircuit(n_qubit)
-        qp_circuit.add_gate(qp_gate)
 
-        tket_circuit = Circuit(n_qubit)
-        tket_circuit.add_gate(tket_gate, [control_index, target_index])
-
-        converted = convert_circuit(qp_circuit)
-        expected = tket_circuit
-
-        assert circuit_equal(converted, expected)
-
-
-three_qubit_gate_mapping: Mapping[Callable[[int, int, int], QuantumGate], OpType] = {
+three_qubit_gate_mapping: Final[
+    dict[Callable[[int, int, int], QuantumGate], OpType]
+] = {
     gates.TOFFOLI: OpType.CCX,
 }
 
 
-def test_convert_three_qubit_gate() -> None:
-    for qp_factory, tket_gate in three_qubit_gate_mapping.items():
-        target_index = 7
-        control_index_1 = 4
-        control_index_2 = 2
-        n_qubit = 8
-
-        qp_gate = qp_factory(control_index_1, control_index_2, target_index)
-        qp_circuit = QuantumCircuit(n_qubit)
-        qp_circuit.add_gate(qp_gate)
-
-        tket_circuit = Circuit(n_qubit)
-        tket_circuit.add_gate(
-            tket_gate, [control_index_1, control_index_2, target_index]
-        )
+@pytest.mark.parametrize(
+    "qp_factory, tket_gate", list(three_qubit_gate_mapping.items())
+)
+def test_convert_three_qubit_gate(
+    qp_factory: Callable[[int, int, int], QuantumGate], tket_gate: OpType
+) -> None:
+    _assert_converts(
+        3, [qp_factory(1, 0, 2)], lambda c: c.add_gate(tket_gate, [1, 0, 2])
+    )
 
-        converted = convert_circuit(qp_circuit)
-        expected = tket_circuit
 
-        assert circuit_equal(converted, expected)
+_EXP_IPI4 = cmath.exp(1j * math.pi / 4)
 
 
-def test_convert_unitary_matrix_1q_gate() -> None:
-    umat = ((1, 0), (0, np.cos(np.pi / 4) + 1j * np.sin(np.pi / 4)))
+@pytest.fixture(scope="session")
+def umat_1q() -> npt.NDArray[np.complex128]:
+    return np.array(((1.0, 0.0), (0.0, _EXP_IPI4)), dtype=np.complex128)
 
-    target_index = 7
-    n_qubit = 8
 
-    qp_gate = gates.UnitaryMatrix((7,), umat)
-    qp_circuit = QuantumCircuit(n_qubit)
-    qp_circuit.add_gate(qp_gate)
+def _haar_random_unitary(
+    n: int, rng: np.random.Generator
+) -> npt.NDArray[np.complex128]:
+    a = rng.standard_normal((n, n)) + 1j * rng.standard_normal((n, n))
+    q, r = np.linalg.qr(a)
+    d = np.diagonal(r)
+    return cast(npt.NDArray[np.complex128], q * (d / np.abs(d)))
 
-    tket_circuit = Circuit(n_qubit)
-    tket_circuit.add_unitary1qbox(Unitary1qBox(umat), target_index)
 
-    converted = convert_circuit(qp_circuit)
-    expected = tket_circuit
+@pytest.fixture(scope="session")
+def umat_2q() -> npt.NDArray[np.complex128]:
+    return _haar_random_unitary(4, np.random.default_rng(0))
 
-    assert circuit_equal(converted, expected)
 
+@pytest.fixture(scope="session")
+def umat_3q() -> npt.NDArray[np.complex128]:
+    return _haar_random_unitary(8, np.random.default_rng(1))
 
-def test_convert_unitary_matrix_2q_gate() -> None:
-    umat = unitary_group.rvs(4)
 
-    target_indices = (4, 7)
-    n_qubit = 8
+@pytest.mark.parametrize(
+    "umat_fixture, target_indices",
+    [("umat_1q", (0,)), ("umat_2q", (0, 1)), ("umat_3q", (0, 1, 2))],
+)
+def test_convert_unitary_matrix_gate(
+    umat_fixture: str, target_indices: tuple[int, ...], request: pytest.FixtureRequest
+) -> None:
+    umat: npt.NDArray[np.complex128] = request.getfixturevalue(umat_fixture)
+    n_qubit = len(target_indices)
 
-    qp_gate = gates.UnitaryMatrix(target_indices, umat)
+    qp_gate = gates.UnitaryMatrix(target_indices, umat.tolist())
     qp_circuit = QuantumCircuit(n_qubit)
     qp_circuit.add_gate(qp_gate)
 
     tket_circuit = Circuit(n_qubit)
-    tket_circuit.add_unitary2qbox(Unitary2qBox(umat), *target_indices)
-
-    converted = convert_circuit(qp_circuit)
-    expected = tket_circuit
-
-    assert circuit_equal(converted, expected)
-
-
-def test_convert_unitary_matrix_3q_gate() -> None:
-    umat = unitary_group.rvs(8)
-
-    target_indices = (4, 5, 7)
-    n_qubit = 8
-
-    qp_gate = gates.UnitaryMatrix(target_indices, umat)
-    qp_circuit = QuantumCircuit(n_qubit)
-    qp_circuit.add_gate(qp_gate)
-
-    tket_circuit = Circuit(n_qubit)
-    tket_circuit.add_unitary3qbox(Unitary3qBox(umat), *target_indices)
+    if n_qubit == 1:
+        tket_circuit.add_unitary1qbox(Unitary1qBox(umat), *target_indices)
+    elif n_qubit == 2:
+        tket_circuit.add_unitary2qbox(Unitary2qBox(umat), *target_indices)
+    else:
+        tket_circuit.add_unitary3qbox(Unitary3qBox(umat), *target_indices)
 
     converted = convert_circuit(qp_circuit)
     expected = tket_circuit
@@ -256,61 +259,32 @@ def test_convert_unitary_matrix_3q_gate() -> None:
 
 def test_convert_u1_gate() -> None:
     lmd1 = 0.125
-
-    target_index = 7
-    n_qubit = 8
-
-    qp_gate = gates.U1(lmd=lmd1, target_index=target_index)
-    qp_circuit = QuantumCircuit(n_qubit)
-    qp_circuit.add_gate(qp_gate)
-
-    tket_circuit = Circuit(n_qubit)
-    tket_circuit.add_gate(OpType.U1, [lmd1 / np.pi], [target_index])
-
-    converted = convert_circuit(qp_circuit)
-    expected = tket_circuit
-
-    assert circuit_equal(converted, expected)
+    _assert_converts(
+        1,
+        [gates.U1(lmd=lmd1, target_index=0)],
+        lambda c: c.add_gate(OpType.U1, [lmd1 / np.pi], [0]),
+    )
 
 
 def test_convert_u2_gate() -> None:
     phi2, lmd2 = 0.125, -0.125
-
-    target_index = 7
-    n_qubit = 8
-
-    qp_gate = gates.U2(lmd=lmd2, phi=phi2, target_index=target_index)
-    qp_circuit = QuantumCircuit(n_qubit)
-    qp_circuit.add_gate(qp_gate)
-
-    tket_circuit = Circuit(n_qubit)
-    tket_circuit.add_gate(OpType.U2, [phi2 / np.pi, lmd2 / np.pi], [target_index])
-
-    converted = convert_circuit(qp_circuit)
-    expected = tket_circuit
-
-    assert circuit_equal(converted, expected)
+    _assert_converts(
+        1,
+        [gates.U2(lmd=lmd2, phi=phi2, target_index=0)],
+        lambda c: c.add_gate(OpType.U2, [phi2 / np.pi, lmd2 / np.pi], [0]),
+    )
 
 
 def test_convert_u3_gate() -> None:
     theta3, phi3, lmd3 = 0.125, -0.125, 0.625
-    target_index = 7
-    n_qubit = 8
-
-    qp_gate = gates.U3(lmd=lmd3, phi=phi3, theta=theta3, target_index=target_index)
-    qp_circuit = QuantumCircuit(n_qubit)
-    qp_circuit.add_gate(qp_gate)
-
-    tket_circuit = Circuit(n_qubit)
-    tket_circuit.add_gate(
-        OpType.U3, [theta3 / np.pi, phi3 / np.pi, lmd3 / np.pi], [target_index]
+    _assert_converts(
+        1,
+        [gates.U3(lmd=lmd3, phi=phi3, theta=theta3, target_index=0)],
+        lambda c: c.add_gate(
+            OpType.U3, [theta3 / np.pi, phi3 / np.pi, lmd3 / np.pi], [0]
+        ),
     )
 
-    converted = convert_circuit(qp_circuit)
-    expected = tket_circuit
-
-    assert circuit_equal(converted, expected)
-
 
 def test_convert_circuit() -> None:
     circuit = QuantumCircuit(3)
@@ -332,4 +306,29 @@ def test_convert_circuit() -> None:
     expected.CX(0, 2)
     expected.Rx(0.125 / np.pi, 0)
 
+    assert converted == expected
+
+
+def test_convert_wide_circuit(umat_2q: npt.NDArray[np.complex128]) -> None:
+    circuit = QuantumCircuit(8)
+    original_gates = [
+        gates.X(7),
+        gates.RY(5, 0.125),
+        gates.CNOT(4, 7),
+        gates.TOFFOLI(4, 2, 7),
+        gates.UnitaryMatrix((4, 7), umat_2q.tolist()),
+    ]
+    for gate in original_gates:
+        circuit.add_gate(gate)
+
+    converted = convert_circuit(circuit)
+    assert converted.n_qubits == 8
+
+    expected = Circuit(8)
+    expected.X(7)
+    expected.Ry(0.125 / np.pi, 5)
+    expected.CX(4, 7)
+    expected.CCX(4, 2, 7)
+    expected.add_unitary2qbox(Unitary2qBox(umat_2q), 4, 7)
+
     assert circuit_equal(converted, expected)
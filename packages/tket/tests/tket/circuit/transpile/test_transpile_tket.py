@@ -8,6 +8,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import mock
+
 import numpy as np
 
 from quri_parts.circuit import QuantumCircuit, gate_names, gates
@@ -60,3 +62,29 @@ def test_optimization() -> None:
     expect = QuantumCircuit(1)
     expect.add_RZ_gate(0, np.pi / 4.0)
     assert target == expect
+
+
+def test_transpile_cache() -> None:
+    backend = mock.Mock()
+    circuit = QuantumCircuit(2)
+    circuit.extend([gates.H(0), gates.X(1), gates.CNOT(0, 1)])
+    same_circuit = QuantumCircuit(2)
+    same_circuit.extend([gates.H(0), gates.X(1), gates.CNOT(0, 1)])
+    other_circuit = QuantumCircuit(2)
+    other_circuit.extend([gates.H(0), gates.Z(1), gates.CNOT(0, 1)])
+
+    transpiler = TketTranspiler(backend=backend, cache_size=1)
+    target = transpiler(circuit)
+    assert target == circuit.freeze()
+    assert transpiler(same_circuit) is target
+    assert backend.default_compilation_pass.call_count == 1
+
+    assert transpiler(other_circuit) == other_circuit.freeze()
+    assert transpiler(circuit) == target
+    assert backend.default_compilation_pass.call_count == 3
+
+    no_cache_transpiler = TketTranspiler(backend=backend, cache_size=0)
+    no_cache_target = no_cache_transpiler(circuit)
+    assert type(no_cache_target) is type(target)
+    no_cache_transpiler(circuit)
+    assert backend.default_compilation_pass.call_count == 5